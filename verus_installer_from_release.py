@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 # /// script
-# dependencies = ["requests"]
+# dependencies = ["requests", "aiohttp", "isal"]
 # ///
 """
 Verus Latest Release Downloader
@@ -10,6 +10,8 @@ Supports latest stable release, latest pre-release, or most recent release.
 """
 
 import requests
+import asyncio
+import io
 import os
 import sys
 import json
@@ -18,35 +20,115 @@ import zipfile
 import tarfile
 import shutil
 import stat
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 import argparse
 
+try:
+    import aiohttp
+except ImportError:  # optional; without it downloads use a single stream
+    aiohttp = None
+
+try:
+    # ISA-L's SIMD inflate is 2-3x faster than stdlib gzip on the ~100 MB
+    # compressed release archives; same GzipFile API
+    from isal import igzip as _gzip
+except ImportError:
+    import gzip as _gzip
+
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Buffer size for archive extraction copies. tarfile defaults to ~16 KiB and
+# zipfile to 8 KiB, which costs tens of thousands of extra read/write
+# syscalls on a multi-hundred-MB Verus release.
+COPY_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Ranged downloads: number of concurrent range requests per asset, and the
+# minimum asset size worth splitting
+RANGED_DOWNLOAD_PARTS = 6
+RANGED_DOWNLOAD_MIN_SIZE = 32 * 1024 * 1024
+
+# Shared HTTP session: keep-alive reuses the TCP+TLS connection between the
+# GitHub API probe and the asset download instead of paying the handshake
+# round-trips on every request
+SESSION = requests.Session()
+SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4,
+                                                        pool_maxsize=8))
+SESSION.headers['Accept'] = 'application/vnd.github+json'
+
+# GitHub API responses are cached alongside their ETag; a repeat run sends
+# If-None-Match and gets a body-less 304 when the release hasn't changed
+ETAG_CACHE_FILE = Path.home() / '.cache' / 'verus-installer' / 'etag.json'
+
+
+def _load_etag_cache():
+    try:
+        with open(ETAG_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_etag_cache(cache):
+    try:
+        ETAG_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(ETAG_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # the cache is best-effort
+
+
+def get_github_json(url):
+    """Fetch a GitHub API URL, reusing the cached body on a 304."""
+    cache = _load_etag_cache()
+    cached = cache.get(url)
+
+    headers = {}
+    if cached:
+        headers['If-None-Match'] = cached['etag']
+
+    response = SESSION.get(url, headers=headers)
+    if response.status_code == 304:
+        return cached['json']
+    response.raise_for_status()
+
+    data = response.json()
+    etag = response.headers.get('ETag')
+    if etag:
+        cache[url] = {'etag': etag, 'json': data}
+        _save_etag_cache(cache)
+    return data
+
+
+# Release-asset name patterns keyed by (system, machine)
+_PATTERNS = {
+    'linux': {
+        'x86_64': 'x86-linux',
+        'amd64': 'x86-linux',
+    },
+    'darwin': {
+        'x86_64': 'x86-macos',
+        'amd64': 'x86-macos',
+        'arm64': 'arm64-macos',
+    },
+    'windows': {
+        'x86_64': 'x86-win',
+        'amd64': 'x86-win',
+    }
+}
+
 
 def get_platform_asset_pattern():
     """Determine the appropriate asset pattern for the current platform."""
     system = platform.system().lower()
     machine = platform.machine().lower()
-    
-    patterns = {
-        'linux': {
-            'x86_64': 'x86-linux',
-            'amd64': 'x86-linux',
-        },
-        'darwin': {
-            'x86_64': 'x86-macos',
-            'amd64': 'x86-macos',
-            'arm64': 'arm64-macos',
-        },
-        'windows': {
-            'x86_64': 'x86-win',
-            'amd64': 'x86-win',
-        }
-    }
-    
-    if system in patterns and machine in patterns[system]:
-        return patterns[system][machine]
-    
+
+    if system in _PATTERNS and machine in _PATTERNS[system]:
+        return _PATTERNS[system][machine]
+
     print(f"Warning: Unknown platform {system}-{machine}")
     return None
 
@@ -61,13 +143,11 @@ def get_latest_release(include_prerelease=False):
     if include_prerelease:
         # Get all releases and find the most recent pre-release
         url = "https://api.github.com/repos/verus-lang/verus/releases"
-        response = requests.get(url)
-        response.raise_for_status()
-        releases = response.json()
-        
+        releases = get_github_json(url)
+
         if not releases:
             raise Exception("No releases found")
-        
+
         # Find the most recent pre-release
         for release in releases:
             if release['prerelease']:
@@ -76,9 +156,7 @@ def get_latest_release(include_prerelease=False):
     else:
         # Get the latest stable release
         url = "https://api.github.com/repos/verus-lang/verus/releases/latest"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
+        return get_github_json(url)
 
 
 def get_specific_release(version):
@@ -88,10 +166,8 @@ def get_specific_release(version):
         version: The version string to search for (e.g., "0.2025.08.25.63ab0cb")
     """
     url = "https://api.github.com/repos/verus-lang/verus/releases"
-    response = requests.get(url)
-    response.raise_for_status()
-    releases = response.json()
-    
+    releases = get_github_json(url)
+
     if not releases:
         raise Exception("No releases found")
     
@@ -139,33 +215,252 @@ def find_asset_for_platform(assets, platform_pattern):
     """Find the appropriate asset for the current platform."""
     if not platform_pattern:
         return None
-    
-    for asset in assets:
-        if platform_pattern in asset['name'].lower():
-            return asset
-    
-    return None
+
+    pattern = platform_pattern.lower()
+    return next((asset for asset in assets if pattern in asset['name'].lower()),
+                None)
+
+
+class _ProgressReader(io.RawIOBase):
+    """Wrap a raw response stream and report bytes read to a callback."""
+
+    def __init__(self, raw, total_size, progress_callback):
+        self._raw = raw
+        self._total_size = total_size
+        self._downloaded = 0
+        self._progress_callback = progress_callback
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        if data:
+            self._downloaded += len(data)
+            if self._progress_callback and self._total_size > 0:
+                self._progress_callback(self._downloaded, self._total_size)
+        return data
+
+
+async def _fetch_range(session, url, fd, start, end, on_progress):
+    """Fetch bytes [start, end] of url and pwrite them into place."""
+    headers = {'Range': f'bytes={start}-{end}'}
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        # Some servers advertise Accept-Ranges but ignore Range on GET and
+        # answer 200 with the full body; pwriting that at six different
+        # offsets would silently corrupt the file
+        if response.status != 206:
+            raise Exception(f"Server ignored Range request "
+                            f"(HTTP {response.status})")
+        content_range = response.headers.get('Content-Range', '')
+        if not content_range.startswith(f'bytes {start}-{end}/'):
+            raise Exception(f"Unexpected Content-Range {content_range!r} "
+                            f"for bytes {start}-{end}")
+        offset = start
+        async for chunk in response.content.iter_chunked(1024 * 1024):
+            # pwrite is safe from concurrent tasks for non-overlapping ranges
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+            on_progress(len(chunk))
+
+
+async def _download_ranges(url, fd, total_size, progress_callback):
+    downloaded = 0
+
+    def on_progress(nbytes):
+        nonlocal downloaded
+        downloaded += nbytes
+        if progress_callback:
+            progress_callback(downloaded, total_size)
+
+    part_size = total_size // RANGED_DOWNLOAD_PARTS
+    ranges = [(i * part_size,
+               total_size - 1 if i == RANGED_DOWNLOAD_PARTS - 1
+               else (i + 1) * part_size - 1)
+              for i in range(RANGED_DOWNLOAD_PARTS)]
+
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(_fetch_range(session, url, fd, start, end, on_progress)
+                               for start, end in ranges))
+
+
+def download_file_ranged(url, filename, total_size, progress_callback=None):
+    """Download a file as concurrent HTTP range requests.
+
+    A single TCP stream is often window-limited well below the available
+    bandwidth; several concurrent ranges over one session saturate it.
+    """
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, total_size)
+        asyncio.run(_download_ranges(url, fd, total_size, progress_callback))
+    finally:
+        os.close(fd)
+    return filename
 
 
 def download_file(url, filename, progress_callback=None):
     """Download a file with progress indication."""
-    response = requests.get(url, stream=True)
+    # Prefer parallel ranged fetches for big assets when the server
+    # advertises range support; needs os.pwrite, which Windows lacks
+    if aiohttp is not None and hasattr(os, 'pwrite'):
+        try:
+            head = SESSION.head(url, allow_redirects=True)
+            head.raise_for_status()
+            total_size = int(head.headers.get('content-length', 0))
+            if (head.headers.get('Accept-Ranges') == 'bytes' and
+                    total_size >= RANGED_DOWNLOAD_MIN_SIZE):
+                # head.url is the post-redirect URL, so the range requests
+                # go straight to the object store
+                return download_file_ranged(head.url, filename, total_size,
+                                            progress_callback)
+        except requests.exceptions.RequestException:
+            pass  # fall back to the single-stream download
+        except Exception as e:
+            # e.g. a server that ignores Range on GET; the single-stream
+            # path below reopens the file with O_TRUNC and starts clean
+            print(f"\nRanged download failed ({e}), retrying single-stream")
+
+    response = SESSION.get(url, stream=True)
     response.raise_for_status()
-    
+    # Decode any transport encoding inside urllib3 (C zlib) instead of
+    # per-chunk in Python
+    response.raw.decode_content = True
+
     total_size = int(response.headers.get('content-length', 0))
-    downloaded = 0
-    
-    with open(filename, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
-                if progress_callback and total_size > 0:
-                    progress_callback(downloaded, total_size)
-    
+    source = response.raw
+    if progress_callback:
+        source = _ProgressReader(response.raw, total_size, progress_callback)
+
+    # Reserve the blocks up front when the size is known; sparing the
+    # filesystem incremental allocation as the file grows keeps a 200+ MB
+    # archive contiguous
+    fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    if total_size > 0 and hasattr(os, 'posix_fallocate'):
+        os.posix_fallocate(fd, 0, total_size)
+
+    # Large reads straight from the socket into the file; much cheaper than
+    # iterating 8 KiB chunks in a Python loop
+    with os.fdopen(fd, 'wb', buffering=COPY_BUFFER_SIZE) as f:
+        shutil.copyfileobj(source, f, COPY_BUFFER_SIZE)
+
     return filename
 
 
+# Regular files up to this size are read off the tar stream and written on
+# the worker pool; larger ones are extracted inline to bound memory use
+_PARALLEL_WRITE_MAX_SIZE = 8 * 1024 * 1024
+
+
+def _write_member(path, data, mode):
+    """Create one extracted file: open, write, close, chmod."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.chmod(path, mode & 0o777)
+
+
+def _extract_tar_stream(tar_ref, extract_to):
+    """Extract a streaming tar, writing small files on a thread pool.
+
+    rustlib ships thousands of tiny .rlib/.rmeta files whose open/write/
+    close/chmod syscalls dominate extraction; running them on worker
+    threads overlaps that cost with decompression on the main thread.
+    """
+    root = os.path.realpath(extract_to)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        pending = []
+        for member in tar_ref:
+            if member.isfile() and member.size <= _PARALLEL_WRITE_MAX_SIZE:
+                # This fast path bypasses tarfile's name handling, so check
+                # ourselves that the member stays inside the extract dir
+                target = os.path.normpath(os.path.join(root, member.name))
+                if not target.startswith(root + os.sep):
+                    raise Exception(f"Refusing to extract {member.name} "
+                                    f"outside {extract_to}")
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                # The stream must be consumed before moving on, so read the
+                # payload here and hand only the write to the pool
+                data = tar_ref.extractfile(member).read()
+                pending.append(executor.submit(_write_member, target, data,
+                                               member.mode))
+                # Bound the payload held in flight; waiting on the oldest
+                # write also surfaces its error instead of dropping it
+                if len(pending) >= 32:
+                    pending.pop(0).result()
+            else:
+                # Directories, links and large files take the normal path
+                tar_ref.extract(member, extract_to)
+
+        # Collect the remaining writes so any failure (ENOSPC, permission
+        # errors, ...) aborts extraction rather than vanishing
+        for future in pending:
+            future.result()
+
+
+def stream_download_and_extract(url, asset_name, extract_to):
+    """Download and extract an archive in a single streaming pass.
+
+    The HTTP response is piped straight into the extractor, so download and
+    decompression/extraction overlap and the archive never touches disk.
+    """
+    extract_to = Path(extract_to)
+    extract_to.mkdir(parents=True, exist_ok=True)
+
+    response = SESSION.get(url, stream=True)
+    response.raise_for_status()
+    # Let urllib3 undo any transport encoding so we see the raw archive bytes
+    response.raw.decode_content = True
+
+    if asset_name.endswith(('.tar.gz', '.tgz')):
+        # Gunzip through _gzip so the ISA-L path is used when available;
+        # 'r|' is tarfile's streaming mode: sequential reads, no seeking
+        with _gzip.GzipFile(fileobj=response.raw) as gz, \
+                tarfile.open(fileobj=gz, mode='r|') as tar_ref:
+            tar_ref.copybufsize = COPY_BUFFER_SIZE
+            _extract_tar_stream(tar_ref, extract_to)
+    elif asset_name.lower().endswith('.zip'):
+        # Zip needs random access to its central directory, so spool the
+        # stream to a temporary file (memory-backed up to 64 MiB)
+        with tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024) as spool:
+            shutil.copyfileobj(response.raw, spool)
+            spool.seek(0)
+            with zipfile.ZipFile(spool) as zip_ref:
+                zip_ref.extractall(extract_to)
+    else:
+        raise Exception(f"Unsupported archive format: {asset_name}")
+
+    print(f"Extracted to: {extract_to}")
+    return extract_to
+
+
+def _zip_target_path(member, extract_to):
+    """Map a zip member to its extraction path, sanitizing the name.
+
+    Replicates what ZipFile.extract does before opening the target: strip
+    drive/absolute prefixes and '.'/'..' components so a hostile archive
+    can't write outside extract_to. Returns None for empty names.
+    """
+    arcname = member.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_parts = ('', os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(part for part in arcname.split(os.path.sep)
+                               if part not in invalid_parts)
+    if os.path.sep == '\\' and hasattr(zipfile.ZipFile, '_sanitize_windows_name'):
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+
+    if not arcname:
+        return None
+    return Path(os.path.normpath(os.path.join(extract_to, arcname)))
+
+
 def extract_archive(archive_path, extract_to):
     """Extract zip or tar.gz archive."""
     archive_path = Path(archive_path)
@@ -174,10 +469,28 @@ def extract_archive(archive_path, extract_to):
     print(f"Extracting {archive_path.name}...")
     
     if archive_path.suffix.lower() == '.zip':
+        # Copy members ourselves with a large buffer; ZipFile.extractall
+        # uses a small default buffer that leaves extraction syscall-bound
         with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
+            for member in zip_ref.infolist():
+                target = _zip_target_path(member, extract_to)
+                if target is None:
+                    continue
+                if member.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(member) as source, open(target, 'wb') as dest:
+                    shutil.copyfileobj(source, dest, COPY_BUFFER_SIZE)
+                mode = member.external_attr >> 16
+                if mode:
+                    os.chmod(target, mode)
     elif archive_path.name.endswith(('.tar.gz', '.tgz')):
-        with tarfile.open(archive_path, 'r:gz') as tar_ref:
+        # Decompress through _gzip (ISA-L when available) and hand tarfile
+        # the plain tar stream
+        with _gzip.GzipFile(archive_path, 'rb') as gz, \
+                tarfile.open(fileobj=gz, mode='r|') as tar_ref:
+            tar_ref.copybufsize = COPY_BUFFER_SIZE
             tar_ref.extractall(extract_to)
     else:
         raise Exception(f"Unsupported archive format: {archive_path.suffix}")
@@ -189,77 +502,106 @@ def extract_archive(archive_path, extract_to):
 def find_verus_binary(extract_dir):
     """Find the verus binary in the extracted directory."""
     extract_dir = Path(extract_dir)
-    
+
     # Common binary names
-    binary_names = ['verus', 'verus.exe']
-    
-    # Search for verus binary
-    for binary_name in binary_names:
-        # Check root of extract directory
-        binary_path = extract_dir / binary_name
-        if binary_path.exists():
-            return binary_path
-        
-        # Check subdirectories
-        for root, dirs, files in os.walk(extract_dir):
-            if binary_name in files:
-                return Path(root) / binary_name
-    
+    binary_names = {'verus', 'verus.exe'}
+
+    # One walk, stopping at the first directory that contains either name
+    for root, dirs, files in os.walk(extract_dir):
+        found = binary_names.intersection(files)
+        if found:
+            return Path(root) / next(iter(found))
+
     return None
 
 
 def make_executable(file_path):
     """Make a file executable on Unix-like systems."""
-    if platform.system() != 'Windows':
+    if not _IS_WINDOWS:
         current_permissions = os.stat(file_path).st_mode
         os.chmod(file_path, current_permissions | stat.S_IEXEC)
 
 
+# Magic numbers that identify executable files: ELF (Linux/Unix), the four
+# Mach-O variants (macOS), and PE (Windows)
+_EXECUTABLE_MAGICS = (b'\x7fELF',
+                      b'\xfe\xed\xfa\xce', b'\xfe\xed\xfa\xcf',
+                      b'\xce\xfa\xed\xfe', b'\xcf\xfa\xed\xfe',
+                      b'MZ')
+
+
+def _iter_files(root):
+    """Yield (os.DirEntry, parent_is_bin) for every file under root.
+
+    Whether the containing directory is a 'bin' directory is decided once
+    per directory during the walk, not once per file.
+    """
+    stack = [(str(root), False)]
+    while stack:
+        directory, in_bin = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, entry.name.lower() == 'bin'))
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry, in_bin
+
+
+def _sniff_and_chmod(file_path):
+    """Mark a single candidate file executable if it looks like a binary."""
+    try:
+        # Read the executable markers through a bare fd; skipping the
+        # Python file object saves a syscall and an allocation per file
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            header = os.read(fd, 4)
+        finally:
+            os.close(fd)
+    except OSError:
+        # If we can't read the file, skip it
+        return
+
+    name = os.path.basename(file_path)
+    if header.startswith(_EXECUTABLE_MAGICS):
+        print(f"Making executable: {file_path}")
+        make_executable(file_path)
+    # Also make files with specific names executable
+    elif name in ('verus', 'rust_verify', 'z3') or name.startswith(('rust_', 'verus')):
+        print(f"Making executable by name: {file_path}")
+        make_executable(file_path)
+
+
 def make_all_binaries_executable(install_dir):
-    """Make all binary files in the installation directory executable."""
-    if platform.system() == 'Windows':
-        return  # Windows doesn't need execute permissions
-    
+    """Make all binary files in the installation directory executable.
+
+    Walks the tree once, sniffing and chmod'ing candidate files on a
+    thread pool (the work is syscall-bound, so threads overlap it well).
+    Returns the path of the verus binary if one was seen, else None.
+    """
     install_dir = Path(install_dir)
-    
-    # Common patterns for binary files
-    binary_patterns = ['*', '*.exe']  # Include all files, but we'll filter below
-    
-    # Walk through all files in the installation directory
-    for file_path in install_dir.rglob('*'):
-        if file_path.is_file():
+    verus_binary = None
+
+    if _IS_WINDOWS:
+        return None  # Windows doesn't need execute permissions
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        for entry, in_bin in _iter_files(install_dir):
+            name = entry.name
+
+            if verus_binary is None and name in ('verus', 'verus.exe'):
+                verus_binary = Path(entry.path)
+
             # Check if it's likely a binary file
-            if (file_path.suffix == '' or file_path.suffix == '.exe' or
-                file_path.name.startswith('rust_') or
-                file_path.name.startswith('verus') or
-                'bin' in str(file_path.parent).lower()):
-                
-                # Try to determine if it's a binary by checking if it's executable-like
-                try:
-                    # Read first few bytes to check for executable markers
-                    with open(file_path, 'rb') as f:
-                        header = f.read(4)
-                        # ELF magic number (Linux/Unix executables)
-                        if header.startswith(b'\x7fELF'):
-                            print(f"Making executable: {file_path}")
-                            make_executable(file_path)
-                        # Mach-O magic numbers (macOS executables)  
-                        elif header.startswith((b'\xfe\xed\xfa\xce', b'\xfe\xed\xfa\xcf', 
-                                              b'\xce\xfa\xed\xfe', b'\xcf\xfa\xed\xfe')):
-                            print(f"Making executable: {file_path}")
-                            make_executable(file_path)
-                        # PE magic number (Windows executables) - though less relevant on Unix
-                        elif header.startswith(b'MZ'):
-                            print(f"Making executable: {file_path}")
-                            make_executable(file_path)
-                        # Also make files with specific names executable
-                        elif (file_path.name in ['verus', 'rust_verify', 'z3'] or
-                              file_path.name.startswith(('rust_', 'verus'))):
-                            print(f"Making executable by name: {file_path}")
-                            make_executable(file_path)
-                except (IOError, OSError):
-                    # If we can't read the file, skip it
-                    pass
+            if (in_bin or '.' not in name or name.endswith('.exe') or
+                    name.startswith(('rust_', 'verus'))):
+                # tar extraction preserves modes, so most binaries arrive
+                # already executable; only sniff and chmod the ones that
+                # lack execute bits
+                if entry.stat().st_mode & 0o111:
+                    continue
+                executor.submit(_sniff_and_chmod, entry.path)
+
+    return verus_binary
 
 
 def setup_verus_installation(extract_dir, install_dir=None):
@@ -273,8 +615,11 @@ def setup_verus_installation(extract_dir, install_dir=None):
     else:
         install_dir = Path(install_dir)
     
-    # Find the verus binary
-    verus_binary = find_verus_binary(extract_dir)
+    # Single pass over the extracted tree: mark binaries executable and
+    # spot the verus binary along the way (copytree preserves the modes)
+    verus_binary = make_all_binaries_executable(extract_dir)
+    if verus_binary is None:
+        verus_binary = find_verus_binary(extract_dir)
     if not verus_binary:
         raise Exception("Could not find verus binary in extracted files")
     
@@ -288,14 +633,18 @@ def setup_verus_installation(extract_dir, install_dir=None):
         print(f"Removing existing installation at {install_dir}")
         shutil.rmtree(install_dir)
     
+    install_dir.parent.mkdir(parents=True, exist_ok=True)
+
     print(f"Installing Verus to: {install_dir}")
-    
-    # Copy all files from binary directory to install directory
-    shutil.copytree(binary_dir, install_dir)
-    
-    # Make all binaries executable
-    make_all_binaries_executable(install_dir)
-    
+
+    # Move the tree when source and destination share a filesystem - a
+    # rename is O(1) versus a full second copy of the ~200 MB tree.
+    # Otherwise fall back to copying.
+    if os.stat(binary_dir).st_dev == os.stat(install_dir.parent).st_dev:
+        os.rename(binary_dir, install_dir)
+    else:
+        shutil.copytree(binary_dir, install_dir)
+
     # Ensure the main verus binary is executable (redundant but safe)
     installed_binary = install_dir / verus_binary.name
     make_executable(installed_binary)
@@ -379,30 +728,49 @@ pause
 
 def setup_path_configuration(install_dir):
     """Set up PATH configuration for the current platform."""
-    if platform.system() == 'Windows':
+    if _IS_WINDOWS:
         return create_windows_batch_script(install_dir)
     else:
         return update_path_in_shell_config(install_dir)
 
 
-def verify_installation(verus_binary):
-    """Verify that Verus is working correctly."""
+def start_verification(verus_binary):
+    """Launch 'verus --version' without waiting for it to finish."""
     print("Verifying Verus installation...")
-    
+
     try:
-        import subprocess
-        result = subprocess.run([str(verus_binary), '--version'], 
-                              capture_output=True, text=True, timeout=30)
-        
-        if result.returncode == 0:
+        return subprocess.Popen([str(verus_binary), '--version'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True)
+    except Exception as e:
+        print(f"⚠ Could not verify installation: {e}")
+        return None
+
+
+def verify_installation(verus_binary, proc=None):
+    """Verify that Verus is working correctly.
+
+    Pass a process from start_verification() to collect a check that was
+    launched earlier; otherwise the check runs synchronously.
+    """
+    if proc is None:
+        proc = start_verification(verus_binary)
+        if proc is None:
+            return False
+
+    try:
+        stdout, stderr = proc.communicate(timeout=30)
+
+        if proc.returncode == 0:
             print(f"✓ Verus is working! Version info:")
-            print(result.stdout.strip())
+            print(stdout.strip())
             return True
         else:
             print(f"⚠ Verus binary exists but returned error:")
-            print(result.stderr.strip() if result.stderr else "Unknown error")
+            print(stderr.strip() if stderr else "Unknown error")
             return False
     except subprocess.TimeoutExpired:
+        proc.kill()
         print("⚠ Verus version check timed out")
         return False
     except Exception as e:
@@ -514,79 +882,85 @@ def main():
         # Create output directory
         output_dir = Path(args.output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Download the asset
+
         filename = output_dir / asset['name']
         download_url = asset['browser_download_url']
-        
-        print(f"Downloading {asset['name']} ({asset['size'] / (1024*1024):.1f} MB)...")
-        print(f"URL: {download_url}")
-        print(f"Saving to: {filename}")
-        
-        download_file(download_url, filename, progress_bar)
-        
-        print(f"\n✓ Download completed: {filename}")
-        
-        # Extract and install if not disabled
-        if not args.no_extract:
-            if filename.suffix.lower() in ['.zip'] or filename.name.endswith(('.tar.gz', '.tgz')):
-                try:
-                    # Extract to temporary directory
-                    temp_extract_dir = output_dir / 'temp_extract'
-                    if temp_extract_dir.exists():
-                        shutil.rmtree(temp_extract_dir)
-                    
-                    extract_archive(filename, temp_extract_dir)
-                    
-                    # Set up installation
-                    install_dir, verus_binary = setup_verus_installation(
-                        temp_extract_dir, args.install_dir
-                    )
-                    
-                    print(f"✓ Verus installed to: {install_dir}")
-                    print(f"✓ Verus binary: {verus_binary}")
-                    
-                    # Verify installation
-                    if verify_installation(verus_binary):
-                        print("✓ Installation verified successfully!")
-                    
-                    # Set up PATH
-                    if not args.no_path:
-                        config_file = setup_path_configuration(install_dir)
-                        
-                        if platform.system() == 'Windows':
-                            print(f"\n📝 Next steps for Windows:")
-                            print(f"   1. Run {config_file} as Administrator to add Verus to PATH")
-                            print(f"   2. Restart your command prompt/PowerShell")
-                            print(f"   3. Type 'verus --version' to verify")
-                        else:
-                            print(f"\n📝 Next steps:")
-                            print(f"   1. Restart your terminal or run: source {config_file}")
-                            print(f"   2. Type 'verus --version' to verify")
-                            print(f"   Or run directly: {verus_binary} --version")
-                    
-                    # Clean up temp directory
-                    shutil.rmtree(temp_extract_dir)
-                    
-                    # Optionally remove downloaded archive
-                    remove_archive = input(f"\nRemove downloaded archive {filename}? (y/N): ").lower()
-                    if remove_archive == 'y':
-                        filename.unlink()
-                        print("✓ Archive removed")
-                    
-                except Exception as e:
-                    print(f"Error during extraction/installation: {e}")
-                    print("You can manually extract and install the downloaded archive.")
-                    sys.exit(1)
-            else:
+        is_archive = (filename.suffix.lower() == '.zip' or
+                      filename.name.endswith(('.tar.gz', '.tgz')))
+
+        if args.no_extract or not is_archive:
+            # Plain download, no extraction
+            print(f"Downloading {asset['name']} ({asset['size'] / (1024*1024):.1f} MB)...")
+            print(f"URL: {download_url}")
+            print(f"Saving to: {filename}")
+
+            download_file(download_url, filename, progress_bar)
+
+            print(f"\n✓ Download completed: {filename}")
+
+            if not is_archive:
                 print(f"Downloaded file is not an archive: {filename}")
                 print("Manual installation may be required.")
-        else:
-            print(f"\nTo manually extract and install:")
-            if filename.suffix.lower() == '.zip':
-                print(f"  unzip '{filename}'")
             else:
-                print(f"  tar -xzf '{filename}'")
+                print(f"\nTo manually extract and install:")
+                if filename.suffix.lower() == '.zip':
+                    print(f"  unzip '{filename}'")
+                else:
+                    print(f"  tar -xzf '{filename}'")
+            return
+
+        try:
+            # Extract to temporary directory, streaming straight from the
+            # response so the archive is never written to disk
+            temp_extract_dir = output_dir / 'temp_extract'
+            if temp_extract_dir.exists():
+                shutil.rmtree(temp_extract_dir)
+
+            print(f"Downloading and extracting {asset['name']} ({asset['size'] / (1024*1024):.1f} MB)...")
+            print(f"URL: {download_url}")
+
+            stream_download_and_extract(download_url, asset['name'], temp_extract_dir)
+
+            # Set up installation
+            install_dir, verus_binary = setup_verus_installation(
+                temp_extract_dir, args.install_dir
+            )
+
+            print(f"✓ Verus installed to: {install_dir}")
+            print(f"✓ Verus binary: {verus_binary}")
+
+            # Kick off the version check; it runs while we write the PATH
+            # configuration and clean up the temp directory
+            verify_proc = start_verification(verus_binary)
+
+            # Set up PATH
+            if not args.no_path:
+                config_file = setup_path_configuration(install_dir)
+
+                if _IS_WINDOWS:
+                    print(f"\n📝 Next steps for Windows:")
+                    print(f"   1. Run {config_file} as Administrator to add Verus to PATH")
+                    print(f"   2. Restart your command prompt/PowerShell")
+                    print(f"   3. Type 'verus --version' to verify")
+                else:
+                    print(f"\n📝 Next steps:")
+                    print(f"   1. Restart your terminal or run: source {config_file}")
+                    print(f"   2. Type 'verus --version' to verify")
+                    print(f"   Or run directly: {verus_binary} --version")
+
+            # Clean up whatever the install rename left behind
+            if temp_extract_dir.exists():
+                shutil.rmtree(temp_extract_dir)
+
+            # Collect the verification result launched earlier
+            if verify_proc is not None and verify_installation(verus_binary, verify_proc):
+                print("✓ Installation verified successfully!")
+
+        except Exception as e:
+            print(f"Error during extraction/installation: {e}")
+            print("You can re-run with --no-extract to download the archive "
+                  "and install it manually.")
+            sys.exit(1)
         
     except requests.exceptions.RequestException as e:
         print(f"Network error: {e}")